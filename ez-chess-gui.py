@@ -11,6 +11,11 @@ TOTAL_HEIGHT = 640
 # Chessboard square size (each square is square)
 SQUARE_SIZE = BOARD_PANEL_WIDTH // 8
 
+# Top-left pixel of each square, indexed by square (rank 8 is drawn at the top)
+SQUARE_XY = tuple((chess.square_file(square) * SQUARE_SIZE,
+                   (7 - chess.square_rank(square)) * SQUARE_SIZE)
+                  for square in chess.SQUARES)
+
 # Colors for board squares
 LIGHT_COLOR = (240, 217, 181)
 DARK_COLOR = (181, 136, 99)
@@ -21,61 +26,135 @@ BUTTON_COLOR = (150, 150, 150)
 BUTTON_HOVER_COLOR = (170, 170, 170)
 BUTTON_TEXT_COLOR = (0, 0, 0)
 
+# Frame rate caps while the window has / lacks input focus
+FPS = 30
+UNFOCUSED_FPS = 5
+
 # Margin for text drawing
 MARGIN = 5
 
+# Outline offsets (in pixels) for board pieces and attacker counts
+PIECE_OUTLINE_OFFSETS = [(dx, dy) for dx in (-2, 2) for dy in (-2, 2)]
+COUNT_OUTLINE_OFFSETS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+# Most pieces that can attack one square: the 8 neighbours block every ray,
+# leaving only the 8 knight squares on top of them.
+MAX_ATTACKERS = 16
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Define piece order (for both white and black) for the toolbox grid
 PIECE_ORDER = [chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN, chess.KING]
 
+# Unicode symbol for each (color, piece_type)
+PIECE_SYMBOLS = {
+    (chess.WHITE, chess.PAWN):   "♙",
+    (chess.WHITE, chess.KNIGHT): "♘",
+    (chess.WHITE, chess.BISHOP): "♗",
+    (chess.WHITE, chess.ROOK):   "♖",
+    (chess.WHITE, chess.QUEEN):  "♕",
+    (chess.WHITE, chess.KING):   "♔",
+    (chess.BLACK, chess.PAWN):   "♟",
+    (chess.BLACK, chess.KNIGHT): "♞",
+    (chess.BLACK, chess.BISHOP): "♝",
+    (chess.BLACK, chess.ROOK):   "♜",
+    (chess.BLACK, chess.QUEEN):  "♛",
+    (chess.BLACK, chess.KING):   "♚",
+}
+
+# Toolbox button height and the top of the piece grid, relative to the top of the panel.
+# The grid has one row per piece type: white in the left column, black in the right.
+BUTTON_HEIGHT = 40
+TOOLBOX_GRID_TOP = 10 + 2 * (BUTTON_HEIGHT + 40)
+
 # ─────────────────────────────────────────────────────────────────────────────
 def piece_unicode(piece):
     """Return the Unicode symbol for a chess piece."""
-    if piece.color == chess.WHITE:
-        symbols = {
-            chess.PAWN:   "♙",
-            chess.KNIGHT: "♘",
-            chess.BISHOP: "♗",
-            chess.ROOK:   "♖",
-            chess.QUEEN:  "♕",
-            chess.KING:   "♔"
-        }
-    else:
-        symbols = {
-            chess.PAWN:   "♟",
-            chess.KNIGHT: "♞",
-            chess.BISHOP: "♝",
-            chess.ROOK:   "♜",
-            chess.QUEEN:  "♛",
-            chess.KING:   "♚"
-        }
-    return symbols.get(piece.piece_type, "?")
-
-def draw_text_with_outline(surface, text, font, pos, text_color, outline_color):
+    return PIECE_SYMBOLS.get((piece.color, piece.piece_type), "?")
+
+def outline_padding(offsets):
+    """Return how far an outline drawn at the given offsets extends past the text."""
+    return max(max(abs(dx), abs(dy)) for dx, dy in offsets)
+
+def render_text_with_outline(font, text, text_color, outline_color, offsets):
     """
-    Draw text with an outline for better readability.
-    Blits the outline (offset in four directions) then the main text.
+    Render text with an outline for better readability into a single surface.
+    Blits the outline (at each offset) then the main text onto a transparent
+    surface padded by the largest offset, so drawing the result is one blit.
     """
     base_text = font.render(text, True, text_color)
     outline_text = font.render(text, True, outline_color)
-    for dx in (-1, 1):
-        for dy in (-1, 1):
-            surface.blit(outline_text, (pos[0] + dx, pos[1] + dy))
-    surface.blit(base_text, pos)
+    pad = outline_padding(offsets)
+    surface = pygame.Surface((base_text.get_width() + 2 * pad,
+                              base_text.get_height() + 2 * pad), pygame.SRCALPHA)
+    for dx, dy in offsets:
+        surface.blit(outline_text, (pad + dx, pad + dy))
+    surface.blit(base_text, (pad, pad))
+    # Match the display's pixel format so blitting takes SDL's fast path.
+    return surface.convert_alpha()
+
+def render_count_surfaces(font, text_color, outline_color):
+    """
+    Pre-render every possible attacker count with its outline.
+    Returns a list of surfaces indexed by count.
+    """
+    return [render_text_with_outline(font, str(count), text_color, outline_color,
+                                     COUNT_OUTLINE_OFFSETS)
+            for count in range(MAX_ATTACKERS + 1)]
+
+def render_piece_surfaces(font):
+    """
+    Pre-render the outlined glyph of every piece once so the draw loop only has to blit.
+    Returns a dict mapping (color, piece_type) to the glyph surface.
+    """
+    surfaces = {}
+    for color in (chess.WHITE, chess.BLACK):
+        if color == chess.WHITE:
+            piece_color = (255, 255, 255)
+            outline_color = (0, 0, 0)
+        else:
+            piece_color = (0, 0, 0)
+            outline_color = (255, 255, 255)
+        for piece_type in PIECE_ORDER:
+            symbol = piece_unicode(chess.Piece(piece_type, color))
+            surfaces[(color, piece_type)] = render_text_with_outline(
+                font, symbol, piece_color, outline_color, PIECE_OUTLINE_OFFSETS)
+    return surfaces
+
+def recompute_attacks(board):
+    """
+    Count the attackers of every square for both colors.
+    Returns:
+        white_counts, black_counts: lists of 64 ints indexed by square.
+    """
+    white_counts = [0] * 64
+    black_counts = [0] * 64
+    # Walk each piece's attack bitboard once and credit every square it hits,
+    # rather than asking "who attacks this square?" for all 64 squares.
+    for color, counts in ((chess.WHITE, white_counts), (chess.BLACK, black_counts)):
+        for square in chess.scan_forward(board.occupied_co[color]):
+            for target in chess.scan_forward(board.attacks_mask(square)):
+                counts[target] += 1
+    return white_counts, black_counts
 
 # ─────────────────────────────────────────────────────────────────────────────
+def toolbox_cell_size(panel_width, panel_height):
+    """Return the (width, height) of one piece icon cell in the toolbox grid."""
+    cell_width = panel_width // 2  # two columns: white and black
+    cell_height = (panel_height - TOOLBOX_GRID_TOP - 10) // len(PIECE_ORDER)  # one row per piece type
+    return cell_width, cell_height
+
 def create_toolbox_layout(panel_x, panel_y, panel_width, panel_height):
     """
     Create and return the rectangles for the two buttons and the piece icons.
     Returns:
         buttons: dict with keys "clear" and "start" mapping to their rects.
-        piece_icons: list of dicts, each with keys: "rect" and "piece".
+        piece_icons: list of dicts, each with keys: "rect", "color" and "piece_type".
                      The list will contain one icon for each piece in the toolbox.
     """
     buttons = {}
     # Define button dimensions
     btn_width = panel_width - 20
-    btn_height = 40
+    btn_height = BUTTON_HEIGHT
     btn_margin = 10
     # Clear button at top
     clear_rect = pygame.Rect(panel_x + 10, panel_y + 10, btn_width, btn_height)
@@ -89,12 +168,13 @@ def create_toolbox_layout(panel_x, panel_y, panel_width, panel_height):
     buttons["attackers"] = attackers_btn_rect
 
     # Define piece grid area below the buttons:
-    grid_top = panel_y + 10 + 2 * (btn_height + 40)  # starting y for piece icons
-    grid_cell_width = panel_width // 2  # two columns: white and black
-    grid_cell_height = (panel_height - grid_top - 10) // len(PIECE_ORDER)  # one row per piece type
+    grid_top = panel_y + TOOLBOX_GRID_TOP  # starting y for piece icons
+    grid_cell_width, grid_cell_height = toolbox_cell_size(panel_width, panel_height)
 
     piece_icons = []
-    # For each piece type in order, add two icons (one white, one black)
+    # For each piece type in order, add two icons (one white, one black).
+    # toolbox_icon_index relies on this order: the icon in a given row and
+    # column is piece_icons[row * 2 + col].
     for row, piece_type in enumerate(PIECE_ORDER):
         # White piece icon
         white_rect = pygame.Rect(
@@ -103,7 +183,7 @@ def create_toolbox_layout(panel_x, panel_y, panel_width, panel_height):
             grid_cell_width,
             grid_cell_height
         )
-        piece_icons.append({"rect": white_rect, "piece": chess.Piece(piece_type, chess.WHITE)})
+        piece_icons.append({"rect": white_rect, "color": chess.WHITE, "piece_type": piece_type})
         # Black piece icon
         black_rect = pygame.Rect(
             panel_x + grid_cell_width,
@@ -111,10 +191,55 @@ def create_toolbox_layout(panel_x, panel_y, panel_width, panel_height):
             grid_cell_width,
             grid_cell_height
         )
-        piece_icons.append({"rect": black_rect, "piece": chess.Piece(piece_type, chess.BLACK)})
+        piece_icons.append({"rect": black_rect, "color": chess.BLACK, "piece_type": piece_type})
 
     return buttons, piece_icons
 
+def button_at(buttons, x, y):
+    """Return the key of the toolbox button under (x, y), or None."""
+    for key, rect in buttons.items():
+        if rect.collidepoint(x, y):
+            return key
+    return None
+
+def toolbox_icon_index(panel_x, panel_y, panel_width, panel_height, x, y):
+    """
+    Return the index into piece_icons of the toolbox icon under (x, y), or None.
+    The icons sit on a regular grid, so the cell is computed directly.
+    Takes the same panel geometry that was passed to create_toolbox_layout.
+    """
+    cell_width, cell_height = toolbox_cell_size(panel_width, panel_height)
+    col = (x - panel_x) // cell_width
+    row = (y - panel_y - TOOLBOX_GRID_TOP) // cell_height
+    if 0 <= col < 2 and 0 <= row < len(PIECE_ORDER):
+        return row * 2 + col
+    return None
+
+def create_board_background():
+    """Paint the static checker pattern once onto an off-screen surface."""
+    board_bg = pygame.Surface((BOARD_PANEL_WIDTH, BOARD_PANEL_WIDTH)).convert()
+    for rank in range(8):
+        for file in range(8):
+            x = file * SQUARE_SIZE
+            y = (7 - rank) * SQUARE_SIZE
+            square_rect = pygame.Rect(x, y, SQUARE_SIZE, SQUARE_SIZE)
+            square_color = LIGHT_COLOR if (rank + file) % 2 == 0 else DARK_COLOR
+            board_bg.fill(square_color, square_rect)
+    return board_bg
+
+def create_panel_background(panel_x, panel_y, panel_width, panel_height, piece_icons):
+    """
+    Paint the static parts of the right panel (background and icon cell borders)
+    once onto an off-screen surface to be blitted at (panel_x, panel_y).
+    """
+    panel_bg = pygame.Surface((panel_width, panel_height)).convert()
+    panel_bg.fill(PANEL_BG_COLOR)
+    for icon in piece_icons:
+        # Icon rects are in screen coordinates; shift them into the panel surface.
+        cell_rect = icon["rect"].move(-panel_x, -panel_y)
+        pygame.draw.rect(panel_bg, (100, 100, 100), cell_rect, 1)
+    return panel_bg
+
 # ─────────────────────────────────────────────────────────────────────────────
 def main():
     pygame.init()
@@ -127,16 +252,33 @@ def main():
     board_piece_font = pygame.font.Font(font_name, 50)
     # For attacker counts
     number_font = pygame.font.SysFont("Arial", SQUARE_SIZE // 3, bold=True)
+    white_count_surfaces = render_count_surfaces(number_font, (255, 255, 255), (0, 0, 0))
+    black_count_surfaces = render_count_surfaces(number_font, (0, 0, 0), (255, 255, 255))
+    # Count surfaces are padded by the outline width on every side.
+    count_pad = outline_padding(COUNT_OUTLINE_OFFSETS)
     # For the toolbox piece icons (smaller)
     toolbox_piece_font = pygame.font.Font(font_name, 50)
+    # For the toolbox button labels
+    button_font = pygame.font.SysFont("Arial", 24, bold=True)
+
+    # Piece glyphs never change, so render them once up front.
+    piece_surfaces = render_piece_surfaces(board_piece_font)
+    toolbox_surfaces = {
+        (color, piece_type): toolbox_piece_font.render(
+            piece_unicode(chess.Piece(piece_type, color)), True, (0, 0, 0)).convert_alpha()
+        for color, piece_type in piece_surfaces
+    }
 
     # ────────────────
     # Initialize the chess board using python-chess.
     board = chess.Board()  # starting position
+    # Attacker counts only change when the board does; recompute them lazily.
+    board_dirty = True
+    white_counts = black_counts = None
 
     # Drag and drop state variables.
     dragging = False           # True if a piece is being dragged
-    dragging_piece = None      # Either a chess.Piece (from board) or a tuple (color, piece_type) from panel
+    dragging_piece = None      # The chess.Piece being dragged (from the board or the panel)
     dragging_source = None     # "board" or "panel"
     dragging_offset = (0, 0)   # Offset within the source rectangle where the drag started
     dragging_pos = None        # Current mouse position while dragging
@@ -148,47 +290,80 @@ def main():
     panel_width = RIGHT_PANEL_WIDTH
     panel_height = TOTAL_HEIGHT
     buttons, piece_icons = create_toolbox_layout(panel_x, panel_y, panel_width, panel_height)
+    # Button labels are fixed, so render each one once.
+    button_labels = {key: button_font.render(key, True, BUTTON_TEXT_COLOR).convert_alpha()
+                     for key in buttons}
+
+    # The checker pattern and panel background never change, so paint them once.
+    board_bg = create_board_background()
+    panel_bg = create_panel_background(panel_x, panel_y, panel_width, panel_height, piece_icons)
 
     # Toggle number of attackers on square
     show_attackers = True
 
+    # Set whenever an event may change what is on screen.
+    dirty = True
+    # Set when only the dragged piece moved, so just its old and new areas need updating.
+    drag_moved = False
+    prev_drag_rect = None
+    # Button currently under the mouse, to notice when the hover highlight changes.
+    hover_key = None
+    # Mouse position as reported by the latest mouse event.
+    last_mouse_pos = (0, 0)
+    # The frame rate is capped lower while the window is in the background.
+    focused = True
+
     running = True
     while running:
-        for event in pygame.event.get():
+        # Sleep in the OS until an event arrives instead of polling, then drain
+        # whatever else is queued. Nothing here is timer-driven, so no timeout.
+        events = [pygame.event.wait()]
+        events.extend(pygame.event.get())
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
+            # The window was uncovered and needs repainting.
+            elif event.type == pygame.VIDEOEXPOSE:
+                dirty = True
+
+            # The window gained or lost input focus.
+            elif event.type == pygame.ACTIVEEVENT:
+                if event.state & pygame.APPINPUTFOCUS:
+                    focused = bool(event.gain)
+                    dirty = True
+
             # ── Mouse Button Down ───────────────────────────────────────────────
             elif event.type == pygame.MOUSEBUTTONDOWN:
+                dirty = True
+                last_mouse_pos = event.pos
                 mouse_x, mouse_y = event.pos
 
                 # Check if the click is in the right panel (toolbox) or board.
                 if mouse_x >= BOARD_PANEL_WIDTH:
                     # Right panel: check if clicking a button first.
-                    clicked_button = None
-                    for key, rect in buttons.items():
-                        if rect.collidepoint(mouse_x, mouse_y):
-                            clicked_button = key
-                            break
+                    clicked_button = button_at(buttons, mouse_x, mouse_y)
                     if clicked_button == "clear":
                         board.clear()  # remove all pieces
+                        board_dirty = True
                     elif clicked_button == "start":
-                        board.set_fen(chess.STARTING_FEN)
+                        board.reset()  # sets the starting bitboards directly, no FEN parse
+                        board_dirty = True
                     elif clicked_button == "attackers":
                         show_attackers = not show_attackers
                     else:
                         # Otherwise, check if clicking on a piece icon.
-                        for icon in piece_icons:
-                            if icon["rect"].collidepoint(mouse_x, mouse_y):
-                                dragging = True
-                                dragging_source = "panel"
-                                # For a panel piece, we store a tuple: (color, piece_type)
-                                piece_info = icon["piece"]
-                                dragging_piece = (piece_info.color, piece_info.piece_type)
-                                # Calculate offset relative to the icon's rect top-left.
-                                dragging_offset = (mouse_x - icon["rect"].x, mouse_y - icon["rect"].y)
-                                dragging_pos = event.pos
-                                break
+                        icon_index = toolbox_icon_index(panel_x, panel_y, panel_width, panel_height,
+                                                        mouse_x, mouse_y)
+                        if icon_index is not None:
+                            icon = piece_icons[icon_index]
+                            dragging = True
+                            dragging_source = "panel"
+                            # The new piece is built once here and placed as-is on drop.
+                            dragging_piece = chess.Piece(icon["piece_type"], icon["color"])
+                            # Calculate offset relative to the icon's rect top-left.
+                            dragging_offset = (mouse_x - icon["rect"].x, mouse_y - icon["rect"].y)
+                            dragging_pos = event.pos
                 else:
                     # Left panel (board area): check if a piece is on the clicked square.
                     file = mouse_x // SQUARE_SIZE
@@ -202,18 +377,21 @@ def main():
                         dragging_origin_square = square
                         # Remove the piece from the board temporarily while dragging.
                         board.remove_piece_at(square)
-                        square_x = file * SQUARE_SIZE
-                        square_y = (7 - rank) * SQUARE_SIZE
+                        board_dirty = True
+                        square_x, square_y = SQUARE_XY[square]
                         dragging_offset = (mouse_x - square_x, mouse_y - square_y)
                         dragging_pos = event.pos
 
             # ── Mouse Motion ─────────────────────────────────────────────────────
             elif event.type == pygame.MOUSEMOTION:
+                last_mouse_pos = event.pos
                 if dragging:
                     dragging_pos = event.pos
+                    drag_moved = True
 
             # ── Mouse Button Up ───────────────────────────────────────────────────
             elif event.type == pygame.MOUSEBUTTONUP:
+                dirty = True
                 if dragging:
                     mouse_x, mouse_y = event.pos
                     # Determine drop location:
@@ -222,12 +400,9 @@ def main():
                         file = mouse_x // SQUARE_SIZE
                         rank = 7 - (mouse_y // SQUARE_SIZE)
                         dest_square = chess.square(file, rank)
-                        # If dragging from the board, move the piece; if from the panel, add a new piece.
-                        if dragging_source == "board":
-                            board.set_piece_at(dest_square, dragging_piece)
-                        elif dragging_source == "panel":
-                            color, piece_type = dragging_piece
-                            board.set_piece_at(dest_square, chess.Piece(piece_type, color))
+                        # Moves a piece dragged from the board, or adds one dragged from the panel.
+                        board.set_piece_at(dest_square, dragging_piece)
+                        board_dirty = True
                     else:
                         # Dropped on the right panel:
                         # If dragging from the board, remove the piece (i.e. do nothing since it's already removed).
@@ -240,135 +415,107 @@ def main():
                     dragging_origin_square = None
                     dragging_pos = None
 
-        # ──────────────────────────────
-        # Draw the board (left panel)
-        for rank in range(8):
-            for file in range(8):
-                x = file * SQUARE_SIZE
-                y = (7 - rank) * SQUARE_SIZE
-                square_rect = pygame.Rect(x, y, SQUARE_SIZE, SQUARE_SIZE)
-                square_color = LIGHT_COLOR if (rank + file) % 2 == 0 else DARK_COLOR
-                pygame.draw.rect(screen, square_color, square_rect)
-
-                # Determine square index and attacker counts using python‑chess.
-                square_index = chess.square(file, rank)
-                white_attackers = board.attackers(chess.WHITE, square_index)
-                black_attackers = board.attackers(chess.BLACK, square_index)
-                white_count = len(white_attackers)
-                black_count = len(black_attackers)
-
-                if show_attackers:
+        # Repaint when the pointer moves onto or off a toolbox button.
+        new_hover_key = button_at(buttons, *last_mouse_pos)
+        if new_hover_key != hover_key:
+            hover_key = new_hover_key
+            dirty = True
+
+        # Only redraw when something on screen may have changed.
+        if dirty or drag_moved:
+            # ──────────────────────────────
+            # Draw the board (left panel)
+            if board_dirty:
+                white_counts, black_counts = recompute_attacks(board)
+                board_dirty = False
+            screen.blit(board_bg, (0, 0))
+            if show_attackers:
+                # Collect the count glyphs and blit them all in one batch.
+                count_blits = []
+                for square_index, (x, y) in enumerate(SQUARE_XY):
+                    # Look up the cached attacker counts for this square.
+                    white_count = white_counts[square_index]
+                    black_count = black_counts[square_index]
+
                     # Draw white attackers count (top left) if nonzero.
                     if white_count > 0:
-                        count_text = str(white_count)
-                        pos = (x + MARGIN, y + MARGIN)
-                        draw_text_with_outline(screen, count_text, number_font, pos,
-                                            (255, 255, 255), (0, 0, 0))
+                        count_surface = white_count_surfaces[white_count]
+                        pos = (x + MARGIN - count_pad, y + MARGIN - count_pad)
+                        count_blits.append((count_surface, pos))
                     # Draw black attackers count (top right) if nonzero.
                     if black_count > 0:
-                        count_text = str(black_count)
-                        text_surface = number_font.render(count_text, True, (0, 0, 0))
-                        text_rect = text_surface.get_rect()
-                        pos = (x + SQUARE_SIZE - text_rect.width - MARGIN,
-                            y + MARGIN)
-                        draw_text_with_outline(screen, count_text, number_font, pos,
-                                            (0, 0, 0), (255, 255, 255))
-
-        # Draw pieces from board state.
-        for square in chess.SQUARES:
-            # Skip the square from which a piece is currently being dragged.
-            if dragging_source == "board" and square == dragging_origin_square:
-                continue
-            piece = board.piece_at(square)
-            if piece:
-                file = chess.square_file(square)
-                rank = chess.square_rank(square)
-                x = file * SQUARE_SIZE
-                y = (7 - rank) * SQUARE_SIZE
-                symbol = piece_unicode(piece)
-                # Determine color and outline
-                if piece.color == chess.WHITE:
-                    piece_color = (255, 255, 255)
-                    outline_color = (0, 0, 0)
-                else:
-                    piece_color = (0, 0, 0)
-                    outline_color = (255, 255, 255)
-                text_surface = board_piece_font.render(symbol, True, piece_color)
+                        count_surface = black_count_surfaces[black_count]
+                        pos = (x + SQUARE_SIZE - count_surface.get_width() + count_pad - MARGIN,
+                            y + MARGIN - count_pad)
+                        count_blits.append((count_surface, pos))
+                screen.blits(count_blits, doreturn=False)
+
+            # Draw pieces from board state.
+            # Only visit occupied squares, reading color and type straight from the bitboards.
+            # The glyphs are collected and blitted in one batch.
+            piece_blits = []
+            white_pieces = board.occupied_co[chess.WHITE]
+            for square in chess.scan_forward(board.occupied):
+                # Skip the square from which a piece is currently being dragged.
+                if dragging_source == "board" and square == dragging_origin_square:
+                    continue
+                color = bool(white_pieces & chess.BB_SQUARES[square])
+                piece_type = board.piece_type_at(square)
+                x, y = SQUARE_XY[square]
+                # The cached glyph already has its outline baked in.
+                text_surface = piece_surfaces[(color, piece_type)]
                 text_rect = text_surface.get_rect(center=(x + SQUARE_SIZE // 2,
                                                            y + SQUARE_SIZE // 2))
-                # Draw outline for clarity.
-                for dx in (-2, 2):
-                    for dy in (-2, 2):
-                        outline_surface = board_piece_font.render(symbol, True, outline_color)
-                        outline_rect = outline_surface.get_rect(center=(x + SQUARE_SIZE // 2 + dx,
-                                                                         y + SQUARE_SIZE // 2 + dy))
-                        screen.blit(outline_surface, outline_rect)
+                piece_blits.append((text_surface, text_rect))
+            screen.blits(piece_blits, doreturn=False)
+
+            # If dragging a piece, draw it following the mouse.
+            drag_rect = None
+            if dragging and dragging_pos:
+                draw_x = dragging_pos[0] - dragging_offset[0]
+                draw_y = dragging_pos[1] - dragging_offset[1]
+                # Use the cached board piece glyphs to draw the dragging piece.
+                text_surface = piece_surfaces[(dragging_piece.color, dragging_piece.piece_type)]
+                text_rect = text_surface.get_rect(center=(draw_x + SQUARE_SIZE // 2,
+                                                           draw_y + SQUARE_SIZE // 2))
                 screen.blit(text_surface, text_rect)
+                drag_rect = text_rect
 
-        # If dragging a piece, draw it following the mouse.
-        if dragging and dragging_pos:
-            draw_x = dragging_pos[0] - dragging_offset[0]
-            draw_y = dragging_pos[1] - dragging_offset[1]
-            # For panel-sourced pieces, construct a chess.Piece-like symbol
-            if dragging_source == "panel":
-                color, piece_type = dragging_piece
-                temp_piece = chess.Piece(piece_type, color)
-                symbol = piece_unicode(temp_piece)
-            else:
-                symbol = piece_unicode(dragging_piece)
-            if (dragging_source == "board" and dragging_piece.color == chess.WHITE) or \
-               (dragging_source == "panel" and dragging_piece[0] == chess.WHITE):
-                piece_color = (255, 255, 255)
-                outline_color = (0, 0, 0)
-            else:
-                piece_color = (0, 0, 0)
-                outline_color = (255, 255, 255)
-            # Use board piece font to draw the dragging piece.
-            text_surface = board_piece_font.render(symbol, True, piece_color)
-            text_rect = text_surface.get_rect(center=(draw_x + SQUARE_SIZE // 2,
-                                                       draw_y + SQUARE_SIZE // 2))
-            for dx in (-2, 2):
-                for dy in (-2, 2):
-                    outline_surface = board_piece_font.render(symbol, True, outline_color)
-                    outline_rect = outline_surface.get_rect(center=(draw_x + SQUARE_SIZE // 2 + dx,
-                                                                     draw_y + SQUARE_SIZE // 2 + dy))
-                    screen.blit(outline_surface, outline_rect)
-            screen.blit(text_surface, text_rect)
-
-        # ──────────────────────────────
-        # Draw the right panel background
-        panel_rect = pygame.Rect(BOARD_PANEL_WIDTH, 0, RIGHT_PANEL_WIDTH, TOTAL_HEIGHT)
-        pygame.draw.rect(screen, PANEL_BG_COLOR, panel_rect)
-
-        # Draw buttons in the toolbox.
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        for key, rect in buttons.items():
-            # Change color on hover
-            if rect.collidepoint(mouse_x, mouse_y):
-                color = BUTTON_HOVER_COLOR
+            # ──────────────────────────────
+            # Draw the right panel background (including the icon cell borders)
+            screen.blit(panel_bg, (panel_x, panel_y))
+
+            # Draw buttons in the toolbox.
+            for key, rect in buttons.items():
+                # Change color on hover
+                if key == hover_key:
+                    color = BUTTON_HOVER_COLOR
+                else:
+                    color = BUTTON_COLOR
+                pygame.draw.rect(screen, color, rect)
+                # Draw button text centered in the rect.
+                text_surf = button_labels[key]
+                text_rect = text_surf.get_rect(center=rect.center)
+                screen.blit(text_surf, text_rect)
+
+            # Draw piece icons on the right panel in one batch.
+            toolbox_blits = []
+            for icon in piece_icons:
+                rect = icon["rect"]
+                text_surf = toolbox_surfaces[(icon["color"], icon["piece_type"])]
+                text_rect = text_surf.get_rect(center=rect.center)
+                toolbox_blits.append((text_surf, text_rect))
+            screen.blits(toolbox_blits, doreturn=False)
+
+            if dirty or prev_drag_rect is None or drag_rect is None:
+                pygame.display.flip()
             else:
-                color = BUTTON_COLOR
-            pygame.draw.rect(screen, color, rect)
-            # Draw button text centered in the rect.
-            text = key
-            btn_font = pygame.font.SysFont("Arial", 24, bold=True)
-            text_surf = btn_font.render(text, True, BUTTON_TEXT_COLOR)
-            text_rect = text_surf.get_rect(center=rect.center)
-            screen.blit(text_surf, text_rect)
-
-        # Draw piece icons on the right panel.
-        for icon in piece_icons:
-            rect = icon["rect"]
-            # Draw a border for the icon cell.
-            pygame.draw.rect(screen, (100, 100, 100), rect, 1)
-            piece = icon["piece"]
-            symbol = piece_unicode(piece)
-            text_surf = toolbox_piece_font.render(symbol, True, (0, 0, 0))
-            text_rect = text_surf.get_rect(center=rect.center)
-            screen.blit(text_surf, text_rect)
-
-        pygame.display.flip()
-        clock.tick(30)
+                # Only the dragged piece moved: update where it was and where it is now.
+                pygame.display.update([prev_drag_rect, drag_rect])
+            prev_drag_rect = drag_rect
+            dirty = False
+            drag_moved = False
+        clock.tick(FPS if focused else UNFOCUSED_FPS)
 
     pygame.quit()
 